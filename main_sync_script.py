@@ -1,8 +1,15 @@
+import argparse
+import contextlib
+import hashlib
+import importlib.util
+import io
 import os
 import shutil # Kept for general file operations, though not directly used in sync now
 import sys
+import threading
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Configuration Paths ---
 # Define the paths for your SD card and local save folders.
@@ -10,67 +17,120 @@ import subprocess
 SD_CARD_BASE_PATH = "/run/media/deck/MINUI"
 SD_CARD_SAVES_PATH = os.path.join(SD_CARD_BASE_PATH, "Saves", "GBA")
 LOCAL_SAVES_PATH = "/home/deck/Documents/emulation/Emulation/saves/retroarch/saves"
+# Same folders with a trailing separator, so target paths can be built by plain concatenation.
+SD_CARD_SAVES_PREFIX = os.path.join(SD_CARD_SAVES_PATH, "")
+LOCAL_SAVES_PREFIX = os.path.join(LOCAL_SAVES_PATH, "")
 
 # Path to the directory containing your external srm-to-sav and sav-to-srm scripts.
 # This assumes the 'srm-to-sav' folder is a sub-directory of where main_sync_script.py is.
 EXTERNAL_CONVERSION_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "srm-to-sav")
 
+# Upper bound on conversions running at the same time. Each one may hold a subprocess
+# plus its pipes and open save files, so this also caps file-descriptor pressure.
+MAX_CONCURRENT_CONVERSIONS = min(8, os.cpu_count() or 4)
+
 # --- Helper Functions for User Output ---
-def display_message(message):
-    """Prints a formatted message to the console."""
-    print(f"\n--- {message} ---")
+def display_message(message, log=None):
+    """Prints a formatted message to the console, or appends it to `log` to be written later by _flush_log."""
+    text = f"\n--- {message} ---"
+    if log is None:
+        print(text)
+    else:
+        log.append(text)
+
+def _flush_log(log):
+    """Writes buffered output lines to stdout in a single call and empties the buffer."""
+    if log:
+        sys.stdout.write("\n".join(log) + "\n")
+        sys.stdout.flush()
+        log.clear()
 
 # --- Core Logic: File Information Retrieval ---
+def _split_save_name(filename):
+    """
+    Splits a save file name into its 'true' base name and lowercased extension,
+    e.g. "My_Game.gba.sav" -> ("My_Game", ".sav") and "My_Game.srm" -> ("My_Game", ".srm").
+    """
+    # Split extension. For "game.gba.sav", this gives ("game.gba", ".sav")
+    name_part_before_ext, actual_ext = os.path.splitext(filename)
+    actual_ext_lower = actual_ext.lower()
+
+    # Determine the 'true' base name for comparison (e.g., "my_game" from "my_game.gba.sav")
+    true_basename = name_part_before_ext
+    if actual_ext_lower == '.sav' and true_basename.lower().endswith('.gba'):
+        true_basename = os.path.splitext(true_basename)[0] # Strips '.gba' from 'game.gba'
+    return true_basename, actual_ext_lower
+
 def get_file_info(directory_path, extensions=None):
     """
     Scans a directory for files with specified extensions and returns their
     'true' base name (without extension or '.gba' suffix), full path, and modification time.
     The 'true' base name is used for consistent comparison between SD and local files.
     Ignores files starting with "._".
-    Returns a dictionary: {true_basename_lower: {'path': full_path, 'mtime': mtime, 'ext': actual_ext}}
+    Returns a dictionary:
+    {true_basename_lower: {'path': full_path, 'mtime': mtime, 'size': size, 'ext': actual_ext, 'basename': true_basename}}
     """
     files_info = {}
     if not os.path.isdir(directory_path):
         return files_info # Return empty if directory doesn't exist
 
-    for filename in os.listdir(directory_path):
-        # --- NEW: Ignore files starting with "._" ---
-        if filename.startswith("._"):
-            # print(f"Skipping hidden/metadata file: {filename}") # Uncomment for debugging
-            continue
-
-        # Split extension. For "game.gba.sav", this gives ("game.gba", ".sav")
-        name_part_before_ext, actual_ext = os.path.splitext(filename)
-
-        # Check if the file has one of the desired extensions (case-insensitive)
-        if extensions and actual_ext.lower() not in [e.lower() for e in extensions]:
-            continue
-
-        # Determine the 'true' base name for comparison (e.g., "my_game" from "my_game.gba.sav")
-        true_basename = name_part_before_ext
-        if actual_ext.lower() == '.sav' and true_basename.lower().endswith('.gba'):
-            true_basename = os.path.splitext(true_basename)[0] # Strips '.gba' from 'game.gba'
-
-        full_path = os.path.join(directory_path, filename)
-        if os.path.isfile(full_path):
+    # Lowercase the wanted extensions once rather than for every file in the directory.
+    ext_set = frozenset(e.lower() for e in extensions) if extensions else None
+
+    # os.scandir yields DirEntry objects whose type (and cached stat) saves a
+    # separate stat syscall per file compared to os.path.isfile/getmtime.
+    with os.scandir(directory_path) as it:
+        for entry in it:
+            filename = entry.name
+            # --- NEW: Ignore files starting with "._" ---
+            if filename.startswith("._"):
+                # print(f"Skipping hidden/metadata file: {filename}") # Uncomment for debugging
+                continue
+
+            true_basename, actual_ext_lower = _split_save_name(filename)
+            # Check if the file has one of the desired extensions (case-insensitive)
+            if ext_set is not None and actual_ext_lower not in ext_set:
+                continue
+
+            full_path = entry.path
             try:
-                mtime = os.path.getmtime(full_path)
-                # Store the true_basename (lowercase) as the key for consistent comparison
-                files_info[true_basename.lower()] = {
-                    'path': full_path,
-                    'mtime': mtime,
-                    'ext': actual_ext.lower() # Store the actual extension found
-                }
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
             except OSError as e:
                 print(f"Warning: Could not get file information for {full_path}: {e}")
+                continue
+
+            # Store the true_basename (lowercase) as the key for consistent comparison
+            files_info[true_basename.lower()] = {
+                'path': full_path,
+                'mtime': st.st_mtime,
+                'size': st.st_size,
+                'ext': actual_ext_lower, # Store the actual extension found
+                'basename': true_basename # Original-case 'true' base name, reused when naming sync targets
+            }
     return files_info
 
 # --- Core Logic: File Comparison ---
-def compare_folders(sd_info, local_info):
+def _file_digest(path):
+    """
+    Returns a BLAKE2b digest of a file's contents, or None if it cannot be read.
+    GBA saves are at most a few hundred KB, so the whole file is read in one go.
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+    except OSError as e:
+        print(f"Warning: Could not read {path} for content check: {e}")
+        return None
+
+def compare_folders(sd_info, local_info, content_check=False):
     """
     Compares file information from SD card and local folders using the 'true' base names.
     Identifies files unique to each location and conflicts (files present in both
     but with different modification times or differing extensions, even if the base name matches).
+    With content_check, same-sized pairs whose bytes are identical are not reported as conflicts,
+    since converting one onto the other would not change anything.
     """
     differences = {
         'sd_only': [],      # Files found only on the SD card
@@ -78,69 +138,143 @@ def compare_folders(sd_info, local_info):
         'conflicts': []     # Files in both, but with differing mtimes or extensions
     }
 
-    # Get a combined list of all unique 'true' basenames (game names) from both locations
-    all_basenames = sorted(list(set(sd_info.keys()).union(local_info.keys())))
-
-    for basename in all_basenames:
-        sd_file = sd_info.get(basename)
+    # Walk the dict views directly rather than materializing a union of the keys.
+    # Ordering does not matter here, print_differences sorts for display.
+    for basename, sd_file in sd_info.items():
         local_file = local_info.get(basename)
 
-        if sd_file and not local_file:
+        if local_file is None:
             # File exists only on SD card
             differences['sd_only'].append(sd_file)
-        elif not sd_file and local_file:
-            # File exists only in local folder
-            differences['local_only'].append(local_file)
-        elif sd_file and local_file:
+        elif abs(sd_file['mtime'] - local_file['mtime']) > 1.0 or sd_file['ext'] != local_file['ext']:
             # File exists in both locations. Check for conflicts.
             # A conflict occurs if modification times differ significantly (more than 1 second)
             # OR if their extensions are different (e.g., .sav on SD, .srm locally)
             # and their modification times are not perfectly identical.
-            if abs(sd_file['mtime'] - local_file['mtime']) > 1.0 or sd_file['ext'] != local_file['ext']:
-                differences['conflicts'].append({
-                    'basename': basename, # The true base name (e.g., 'my_game')
-                    'sd': sd_file,
-                    'local': local_file
-                })
+            if content_check and sd_file['size'] == local_file['size']:
+                sd_digest = _file_digest(sd_file['path'])
+                if sd_digest is not None and sd_digest == _file_digest(local_file['path']):
+                    continue # Byte-identical, nothing to sync
+            # Decide once which side is newer so neither sync direction has to re-check.
+            # Within the 1 second tolerance the pair only differs by extension: 'equal'.
+            if sd_file['mtime'] > local_file['mtime'] + 1.0:
+                winner = 'sd'
+            elif local_file['mtime'] > sd_file['mtime'] + 1.0:
+                winner = 'local'
+            else:
+                winner = 'equal'
+            differences['conflicts'].append({
+                'basename': basename, # Lowercased comparison key, for display only; never build paths from it
+                'sd': sd_file,
+                'local': local_file,
+                'winner': winner # 'sd', 'local' or 'equal'
+            })
+
+    for basename, local_file in local_info.items():
+        if basename not in sd_info:
+            # File exists only in local folder
+            differences['local_only'].append(local_file)
     return differences
 
 # --- Core Logic: Conversion Script Execution ---
+# Names of the external conversion scripts expected in EXTERNAL_CONVERSION_SCRIPTS_DIR.
+CONVERSION_SCRIPTS = ("sav-to-srm.py", "srm-to-sav.py")
+
+# Conversion scripts imported in-process, keyed by script name (see _load_conversion_modules).
+_conversion_modules = {}
+# Serializes in-process convert() calls. The third-party scripts make no thread-safety
+# promises, and capturing their output swaps the process-wide sys.stdout/sys.stderr,
+# so only one in-process conversion may run at a time even though the pool has more workers.
+_in_process_conversion_lock = threading.Lock()
+
+def _load_conversion_modules():
+    """
+    Imports the external conversion scripts once so conversions can run in-process
+    instead of launching a new Python interpreter for every save file.
+    Only scripts exposing a callable `convert(input_path, output_path)` are kept;
+    anything that fails to import or lacks that entry point falls back to subprocess.
+    """
+    if EXTERNAL_CONVERSION_SCRIPTS_DIR not in sys.path:
+        # Mirrors the subprocess cwd so the scripts' own relative imports still resolve.
+        sys.path.insert(0, EXTERNAL_CONVERSION_SCRIPTS_DIR)
+
+    for script_name in CONVERSION_SCRIPTS:
+        script_full_path = os.path.join(EXTERNAL_CONVERSION_SCRIPTS_DIR, script_name)
+        if not os.path.isfile(script_full_path):
+            continue
+        # "sav-to-srm.py" is not a valid module name, so load it from its file location.
+        module_name = os.path.splitext(script_name)[0].replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, script_full_path)
+        if spec is None or spec.loader is None:
+            continue
+        module = importlib.util.module_from_spec(spec)
+        try:
+            # Scripts without a __main__ guard may parse arguments or print on import;
+            # silence that and treat any failure (including SystemExit) as "not importable".
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                spec.loader.exec_module(module)
+        except (Exception, SystemExit):
+            continue
+        if callable(getattr(module, "convert", None)):
+            _conversion_modules[script_name] = module
+
 def _run_conversion_script(script_name, input_path, output_path):
     """
-    Helper function to execute an external conversion script using subprocess.
+    Helper function to execute an external conversion script.
+    If the script was imported by _load_conversion_modules, its convert() function is
+    called directly; otherwise the script is run using subprocess.
     IMPORTANT: When passing arguments as a list to subprocess.run (shell=False, the default),
     Python correctly handles spaces in file paths without requiring explicit quotes
     around the path strings themselves. Adding quotes to the strings here would
     make the literal quote characters part of the path, likely causing errors.
     """
+    # Output paths always point into SD_CARD_SAVES_PATH or LOCAL_SAVES_PATH, which main()
+    # verifies (or creates) once up-front, so no per-file directory check is needed here.
+
+    module = _conversion_modules.get(script_name)
+    if module is not None:
+        # Like the subprocess path: stdout is discarded, stderr is only reported on failure,
+        # and a sys.exit() inside the script becomes a per-file error instead of ending the sync.
+        stderr_buffer = io.StringIO()
+        try:
+            with _in_process_conversion_lock, \
+                    contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr_buffer):
+                module.convert(input_path, output_path)
+            return output_path
+        except (Exception, SystemExit) as e:
+            stderr = stderr_buffer.getvalue().strip()
+            raise IOError(
+                f"Conversion failed for {os.path.basename(input_path)} -> {os.path.basename(output_path)} "
+                f" using {script_name}: {e!r}"
+                + (f"\nStderr: {stderr}" if stderr else "")
+            )
+
     script_full_path = os.path.join(EXTERNAL_CONVERSION_SCRIPTS_DIR, script_name)
     if not os.path.exists(script_full_path):
         raise FileNotFoundError(f"External conversion script not found: {script_full_path}")
     if not os.path.isfile(script_full_path):
         raise FileNotFoundError(f"External conversion script is not a file: {script_full_path}")
 
-    # Ensure the output directory exists before the conversion script tries to write to it.
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
-
     # Use sys.executable to ensure the correct python interpreter is used to run the external script.
     # Paths are passed as separate list elements; subprocess.run handles spaces correctly.
     command = [sys.executable, script_full_path, '-i', input_path, '-o', output_path]
-    print(f"  Executing conversion: {' '.join(command)}") # Log the command for debugging
+    # This runs on a worker thread, so logging is left to the caller to keep output ordered.
 
     try:
         # Run the subprocess. `check=False` allows us to handle non-zero exit codes manually.
         # `cwd` is set to EXTERNAL_CONVERSION_SCRIPTS_DIR in case the external scripts have relative imports.
-        result = subprocess.run(command, capture_output=True, text=True, check=False, cwd=EXTERNAL_CONVERSION_SCRIPTS_DIR)
+        # Stdout is discarded and stderr is kept as raw bytes; it is only decoded if the script fails.
+        result = subprocess.run(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False, cwd=EXTERNAL_CONVERSION_SCRIPTS_DIR
+        )
 
         if result.returncode != 0:
-            # If the external script failed, raise a RuntimeError with its stderr/stdout.
+            # If the external script failed, raise a RuntimeError with its stderr.
+            stderr = result.stderr.decode(errors="replace").strip()
             error_message = (
                 f"Conversion failed for {os.path.basename(input_path)} -> {os.path.basename(output_path)} "
                 f" using {script_name}.\n"
-                f"Stderr: {result.stderr.strip() or 'No Stderr'}\n"
-                f"Stdout: {result.stdout.strip() or 'No Stdout'}"
+                f"Stderr: {stderr or 'No Stderr'}"
             )
             raise RuntimeError(error_message)
         # print(f"  Conversion successful: {os.path.basename(input_path)} -> {os.path.basename(output_path)}")
@@ -150,57 +284,96 @@ def _run_conversion_script(script_name, input_path, output_path):
         raise IOError(f"Failed to run conversion command: {e}")
 
 # --- Sync Operations ---
+def _run_conversion_jobs(script_name, tasks, log):
+    """
+    Runs all queued conversions for one sync direction through a single thread pool,
+    so the pool stays busy across new files and conflict resolutions alike.
+    Each task is (input_path, target_path, success_message, error_prefix). Each task
+    mostly waits on file IO or a subprocess, so threads are enough to overlap that work.
+    Results are appended to `log` from the calling thread as they finish; returns the number converted.
+    """
+    processed_count = 0
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CONVERSIONS) as executor:
+        futures = {
+            executor.submit(_run_conversion_script, script_name, input_path, target_path): (success_message, error_prefix)
+            for input_path, target_path, success_message, error_prefix in tasks
+        }
+        for future in as_completed(futures):
+            success_message, error_prefix = futures[future]
+            try:
+                future.result()
+                log.append(success_message)
+                processed_count += 1
+            except Exception as e:
+                log.append(f"{error_prefix}: {e}")
+    return processed_count
+
 def sync_sd_to_local(sd_info, local_info, differences):
     """
     Syncs files from the SD card to the local folder.
     This direction treats the SD card as the "source of truth".
     It copies and converts .sav files from SD (e.g., 'game.gba.sav')
     to .srm files in the local folder (e.g., 'game.srm').
+    Conversions run concurrently in a thread pool; output is buffered on the main thread
+    and written once per phase (queueing, then conversion results).
     """
-    display_message("Initiating Sync: SD Card to Local Folder")
-    processed_count = 0
+    log = []
+    display_message("Initiating Sync: SD Card to Local Folder", log)
+    # Each task is (input_path, target_path, success_message, error_prefix)
+    tasks = []
 
-    # 1. Process files found ONLY on the SD card
+    # 1. Queue files found ONLY on the SD card
     for sd_file in differences['sd_only']:
         # sd_file['path'] is like /path/to/my_game.gba.sav
-        # basename_for_output will be 'my_game'
-        basename_for_output = os.path.splitext(os.path.splitext(os.path.basename(sd_file['path']))[0])[0]
+        # basename_for_output will be 'my_game' (already parsed by get_file_info)
+        basename_for_output = sd_file['basename']
+        sd_name = os.path.basename(sd_file['path'])
         # Target path in local folder will be with .srm extension: /path/to/my_game.srm
-        target_path = os.path.join(LOCAL_SAVES_PATH, f"{basename_for_output}.srm")
-        try:
-            _run_conversion_script("sav-to-srm.py", sd_file['path'], target_path)
-            print(f"  -> Copied '{os.path.basename(sd_file['path'])}' (SD) to '{os.path.basename(target_path)}' (Local).")
-            processed_count += 1
-        except Exception as e:
-            print(f"  Error copying/converting '{os.path.basename(sd_file['path'])}' to Local: {e}")
-
-    # 2. Process conflicts (files in both locations that differ)
+        target_name = f"{basename_for_output}.srm"
+        tasks.append((
+            sd_file['path'],
+            f"{LOCAL_SAVES_PREFIX}{target_name}",
+            f"  -> Copied '{sd_name}' (SD) to '{target_name}' (Local).",
+            f"  Error copying/converting '{sd_name}' to Local",
+        ))
+
+    # 2. Queue conflicts (files in both locations that differ)
     for conflict in differences['conflicts']:
         sd_file = conflict['sd']
         local_file = conflict['local']
-        # The basename from conflicts is already the 'true' base name (e.g., 'my_game')
-        basename_for_output = conflict['basename']
+        # conflict['basename'] is the lowercased comparison key, used for display only.
+        # The target is the conflicting local file's own path, so that exact file is
+        # overwritten even when its name's case differs from the SD file's.
+        game_name = conflict['basename']
 
-        # Determine which file to prioritize for this sync direction (SD to Local)
-        if sd_file['mtime'] > local_file['mtime']:
+        # compare_folders already decided which file is newer
+        if conflict['winner'] == 'sd':
             # SD card version is newer, so we update the local file
-            target_path = os.path.join(LOCAL_SAVES_PATH, f"{basename_for_output}.srm")
-            try:
-                _run_conversion_script("sav-to-srm.py", sd_file['path'], target_path)
-                print(f"  -> Resolved conflict for '{basename_for_output}': Updated Local with newer SD file '{os.path.basename(sd_file['path'])}'.")
-                processed_count += 1
-            except Exception as e:
-                print(f"  Error resolving conflict for '{basename_for_output}' (SD->Local): {e}")
-        elif sd_file['ext'] == '.sav' and local_file['ext'] == '.srm' and abs(sd_file['mtime'] - local_file['mtime']) <= 1.0:
+            tasks.append((
+                sd_file['path'],
+                local_file['path'],
+                f"  -> Resolved conflict for '{game_name}': Updated Local with newer SD file '{os.path.basename(sd_file['path'])}'.",
+                f"  Error resolving conflict for '{game_name}' (SD->Local)",
+            ))
+        elif conflict['winner'] == 'equal':
              # Case: SD is .sav, Local is .srm, mtimes are practically the same.
              # This implies they are likely the same save just with different extensions.
              # No action needed in this direction as local already has the .srm equivalent.
-             print(f"  -> Skipping '{basename_for_output}': Local version already exists as .srm with similar modification time to SD's .sav.")
+             log.append(f"  -> Skipping '{game_name}': Local version already exists as .srm with similar modification time to SD's .sav.")
         else:
             # Local version is newer or preferred in other scenarios.
-            print(f"  -> Skipping '{basename_for_output}': Local version appears newer or preferred. Choose Local to SD sync to update SD if desired.")
+            log.append(f"  -> Skipping '{game_name}': Local version appears newer or preferred. Choose Local to SD sync to update SD if desired.")
+
+    # Show the header and any skips before the conversions start.
+    _flush_log(log)
 
-    display_message(f"SD to Local Sync Complete. {processed_count} files processed/updated.")
+    # 3. Run every queued conversion (new files and conflicts alike) in one pool submission.
+    # Flush in `finally` so results already collected are still shown if the run is interrupted.
+    try:
+        processed_count = _run_conversion_jobs("sav-to-srm.py", tasks, log)
+        display_message(f"SD to Local Sync Complete. {processed_count} files processed/updated.", log)
+    finally:
+        _flush_log(log)
 
 def sync_local_to_sd(sd_info, local_info, differences):
     """
@@ -208,51 +381,66 @@ def sync_local_to_sd(sd_info, local_info, differences):
     This direction treats the local folder as the "source of truth".
     It copies and converts .srm files from local (e.g., 'game.srm')
     to .sav files on the SD card (e.g., 'game.gba.sav').
+    Conversions run concurrently in a thread pool; output is buffered on the main thread
+    and written once per phase (queueing, then conversion results).
     """
-    display_message("Initiating Sync: Local Folder to SD Card")
-    processed_count = 0
+    log = []
+    display_message("Initiating Sync: Local Folder to SD Card", log)
+    # Each task is (input_path, target_path, success_message, error_prefix)
+    tasks = []
 
-    # 1. Process files found ONLY in the local folder
+    # 1. Queue files found ONLY in the local folder
     for local_file in differences['local_only']:
         # local_file['path'] is like /path/to/my_game.srm
-        # basename_for_output will be 'my_game'
-        basename_for_output = os.path.splitext(os.path.basename(local_file['path']))[0]
+        # game_name will be 'my_game' (already parsed by get_file_info)
+        game_name = local_file['basename']
+        local_name = os.path.basename(local_file['path'])
         # Target path on SD card will be with .gba.sav extension: /path/to/my_game.gba.sav
-        target_path = os.path.join(SD_CARD_SAVES_PATH, f"{basename_for_output}.gba.sav")
-        try:
-            _run_conversion_script("srm-to-sav.py", local_file['path'], target_path)
-            print(f"  -> Copied '{os.path.basename(local_file['path'])}' (Local) to '{os.path.basename(target_path)}' (SD).")
-            processed_count += 1
-        except Exception as e:
-            print(f"  Error copying/converting '{os.path.basename(local_file['path'])}' to SD: {e}")
-
-    # 2. Process conflicts (files in both locations that differ)
+        target_name = f"{game_name}.gba.sav"
+        tasks.append((
+            local_file['path'],
+            f"{SD_CARD_SAVES_PREFIX}{target_name}",
+            f"  -> Copied '{local_name}' (Local) to '{target_name}' (SD).",
+            f"  Error copying/converting '{local_name}' to SD",
+        ))
+
+    # 2. Queue conflicts (files in both locations that differ)
     for conflict in differences['conflicts']:
         sd_file = conflict['sd']
         local_file = conflict['local']
-        # The basename from conflicts is already the 'true' base name (e.g., 'my_game')
-        basename_for_output = conflict['basename']
+        # conflict['basename'] is the lowercased comparison key, used for display only.
+        # The target is the conflicting SD file's own path, so that exact file is overwritten
+        # even when its case differs or it has no '.gba' part (e.g. 'Pokemon.sav').
+        game_name = conflict['basename']
 
-        # Determine which file to prioritize for this sync direction (Local to SD)
-        if local_file['mtime'] > sd_file['mtime']:
+        # compare_folders already decided which file is newer
+        if conflict['winner'] == 'local':
             # Local version is newer, so we update the SD card file
-            target_path = os.path.join(SD_CARD_SAVES_PATH, f"{basename_for_output}.gba.sav")
-            try:
-                _run_conversion_script("srm-to-sav.py", local_file['path'], target_path)
-                print(f"  -> Resolved conflict for '{basename_for_output}': Updated SD with newer Local file '{os.path.basename(local_file['path'])}'.")
-                processed_count += 1
-            except Exception as e:
-                print(f"  Error resolving conflict for '{basename_for_output}' (Local->SD): {e}")
-        elif sd_file['ext'] == '.sav' and local_file['ext'] == '.srm' and abs(sd_file['mtime'] - local_file['mtime']) <= 1.0:
+            tasks.append((
+                local_file['path'],
+                sd_file['path'],
+                f"  -> Resolved conflict for '{game_name}': Updated SD with newer Local file '{os.path.basename(local_file['path'])}'.",
+                f"  Error resolving conflict for '{game_name}' (Local->SD)",
+            ))
+        elif conflict['winner'] == 'equal':
              # Case: SD is .sav, Local is .srm, mtimes are practically the same.
              # This implies they are likely the same save just with different extensions.
              # No action needed in this direction as SD already has the .sav equivalent.
-             print(f"  -> Skipping '{basename_for_output}': SD version already exists as .sav with similar modification time to Local's .srm.")
+             log.append(f"  -> Skipping '{game_name}': SD version already exists as .sav with similar modification time to Local's .srm.")
         else:
             # SD version is newer or preferred in other scenarios.
-            print(f"  -> Skipping '{basename_for_output}': SD version appears newer or preferred. Choose SD to Local sync to update Local if desired.")
+            log.append(f"  -> Skipping '{game_name}': SD version appears newer or preferred. Choose SD to Local sync to update Local if desired.")
 
-    display_message(f"Local to SD Sync Complete. {processed_count} files processed/updated.")
+    # Show the header and any skips before the conversions start.
+    _flush_log(log)
+
+    # 3. Run every queued conversion (new files and conflicts alike) in one pool submission.
+    # Flush in `finally` so results already collected are still shown if the run is interrupted.
+    try:
+        processed_count = _run_conversion_jobs("srm-to-sav.py", tasks, log)
+        display_message(f"Local to SD Sync Complete. {processed_count} files processed/updated.", log)
+    finally:
+        _flush_log(log)
 
 def print_differences(differences):
     """Prints the identified differences in a user-friendly format."""
@@ -266,26 +454,30 @@ def print_differences(differences):
     # Print files found only on SD card
     if differences['sd_only']:
         print("\n--- Files found ONLY on SD Card (will be copied to Local if syncing SD -> Local):")
-        for f in differences['sd_only']:
-            print(f"  - {os.path.basename(f['path'])} (Last Modified: {time.ctime(f['mtime'])})")
+        # Take each file name once; it is used both to sort and to print.
+        names = [(os.path.basename(f['path']), f) for f in differences['sd_only']]
+        for name, f in sorted(names, key=lambda item: item[0].lower()):
+            print(f"  - {name} (Last Modified: {time.ctime(f['mtime'])})")
 
     # Print files found only in local folder
     if differences['local_only']:
         print("\n--- Files found ONLY in Local Folder (will be copied to SD if syncing Local -> SD):")
-        for f in differences['local_only']:
-            print(f"  - {os.path.basename(f['path'])} (Last Modified: {time.ctime(f['mtime'])})")
+        # Take each file name once; it is used both to sort and to print.
+        names = [(os.path.basename(f['path']), f) for f in differences['local_only']]
+        for name, f in sorted(names, key=lambda item: item[0].lower()):
+            print(f"  - {name} (Last Modified: {time.ctime(f['mtime'])})")
 
     # Print conflicts
     if differences['conflicts']:
         print("\n--- Conflicts (Files present in both, but differ by modification time or extension):")
-        for c in differences['conflicts']:
+        for c in sorted(differences['conflicts'], key=lambda c: c['basename']):
             print(f"\n  - Game Base Name: {c['basename']}")
             print(f"    SD Card : {os.path.basename(c['sd']['path'])} (Last Modified: {time.ctime(c['sd']['mtime'])}, Ext: {c['sd']['ext']})")
             print(f"    Local   : {time.ctime(c['local']['mtime'])}, Ext: {c['local']['ext']})")
             # Suggest which version is newer
-            if c['sd']['mtime'] > c['local']['mtime']:
+            if c['winner'] == 'sd':
                 print("    (SD Card version is NEWER)")
-            elif c['local']['mtime'] > c['sd']['mtime']:
+            elif c['winner'] == 'local':
                 print("    (Local version is NEWER)")
             else:
                 print("    (Modification times are similar, but extensions might differ)")
@@ -293,6 +485,14 @@ def print_differences(differences):
 
 # --- Main Program Execution Flow ---
 def main():
+    parser = argparse.ArgumentParser(description="Sync GBA saves between an SD card and local RetroArch saves.")
+    parser.add_argument(
+        "--content-check",
+        action="store_true",
+        help="Don't report files as conflicts when their contents are byte-identical (reads both files)."
+    )
+    args = parser.parse_args()
+
     display_message("GBA Save Sync Tool for Steam Deck")
 
     # --- Initial Path and Directory Checks ---
@@ -327,19 +527,26 @@ def main():
         print("Exiting.")
         return
 
+    # Import the conversion scripts once up-front so each save can be converted in-process.
+    _load_conversion_modules()
+
     # --- Get file information from both locations ---
     # Collects details about save files from both the SD card and local storage.
-    # SD card typically uses .sav for GBA saves (e.g., game.gba.sav)
-    sd_info = get_file_info(SD_CARD_SAVES_PATH, ['.sav'])
-    # RetroArch locally typically uses .srm for save RAM (e.g., game.srm)
-    local_info = get_file_info(LOCAL_SAVES_PATH, ['.srm'])
+    # The two folders live on independent devices (SD card vs internal storage), so they are
+    # scanned concurrently to overlap the SD card's slower stat latency with the local scan.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # SD card typically uses .sav for GBA saves (e.g., game.gba.sav)
+        sd_future = executor.submit(get_file_info, SD_CARD_SAVES_PATH, ['.sav'])
+        # RetroArch locally typically uses .srm for save RAM (e.g., game.srm)
+        local_future = executor.submit(get_file_info, LOCAL_SAVES_PATH, ['.srm'])
+        sd_info, local_info = sd_future.result(), local_future.result()
 
     print(f"Found {len(sd_info)} GBA save files on SD card in '{SD_CARD_SAVES_PATH}'.")
     print(f"Found {len(local_info)} RetroArch save files locally in '{LOCAL_SAVES_PATH}'.")
 
     # --- Compare and display differences ---
     # Identifies what needs to be synced or reconciled.
-    differences = compare_folders(sd_info, local_info)
+    differences = compare_folders(sd_info, local_info, content_check=args.content_check)
     has_diff = print_differences(differences)
 
     if not has_diff: